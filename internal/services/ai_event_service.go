@@ -7,9 +7,11 @@ import (
 	"os"
 	"strings"
 	"time"
+	"unicode/utf8"
 
 	"github.com/EasyPeek/EasyPeek-backend/internal/database"
 	"github.com/EasyPeek/EasyPeek-backend/internal/models"
+	"github.com/EasyPeek/EasyPeek-backend/internal/utils"
 	"gorm.io/gorm"
 )
 
@@ -205,6 +207,9 @@ func GetPredefinedTopics() []TopicClassification {
 	}
 }
 
+// defaultTopicMatcher 预定义主题的关键词匹配器
+var defaultTopicMatcher = newTopicMatcher(GetPredefinedTopics())
+
 // DefaultAIEventConfig 获取默认AI事件配置
 func DefaultAIEventConfig() *AIEventConfig {
 	apiKey := ""
@@ -787,48 +792,50 @@ func (s *AIEventService) extractTitleKeywords(title string) map[string]int {
 	return keywords
 }
 
+// titleStopWords 标题关键词提取使用的停用词表
+var titleStopWords = map[string]bool{
+	"的": true, "了": true, "在": true, "是": true, "我": true,
+	"有": true, "和": true, "就": true, "不": true, "人": true,
+	"都": true, "一": true, "一个": true, "上": true, "也": true,
+	"很": true, "到": true, "说": true, "要": true, "去": true,
+	"你": true, "会": true, "着": true, "没有": true, "看": true,
+	"好": true, "自己": true, "这": true, "那": true, "里": true,
+	"就是": true, "还是": true, "但是": true, "因为": true, "所以": true,
+	"如果": true, "虽然": true, "然后": true, "现在": true, "已经": true,
+	"可以": true, "应该": true, "需要": true, "可能": true, "或者": true,
+	"今天": true, "昨天": true, "明天": true, "今年": true, "去年": true,
+	"今日": true, "近日": true, "日前": true, "近期": true, "目前": true,
+}
+
 // isValidKeyword 判断是否为有效关键词
 func (s *AIEventService) isValidKeyword(word string) bool {
 	// 过滤掉停用词和无意义的词
-	stopWords := map[string]bool{
-		"的": true, "了": true, "在": true, "是": true, "我": true,
-		"有": true, "和": true, "就": true, "不": true, "人": true,
-		"都": true, "一": true, "一个": true, "上": true, "也": true,
-		"很": true, "到": true, "说": true, "要": true, "去": true,
-		"你": true, "会": true, "着": true, "没有": true, "看": true,
-		"好": true, "自己": true, "这": true, "那": true, "里": true,
-		"就是": true, "还是": true, "但是": true, "因为": true, "所以": true,
-		"如果": true, "虽然": true, "然后": true, "现在": true, "已经": true,
-		"可以": true, "应该": true, "需要": true, "可能": true, "或者": true,
-		"今天": true, "昨天": true, "明天": true, "今年": true, "去年": true,
-		"今日": true, "近日": true, "日前": true, "近期": true, "目前": true,
-	}
-
-	return !stopWords[word] && len([]rune(word)) >= 2
+	return !titleStopWords[word] && utf8.RuneCountInString(word) >= 2
 }
 
 // generateEventContent 生成事件内容
 func (s *AIEventService) generateEventContent(articles []NewsArticle) string {
-	content := "# 事件总结\n\n"
-	content += "## 相关新闻\n\n"
+	var content strings.Builder
+	content.WriteString("# 事件总结\n\n")
+	content.WriteString("## 相关新闻\n\n")
 
 	for i, article := range articles {
-		content += fmt.Sprintf("### %d. %s\n", i+1, article.Title)
-		content += fmt.Sprintf("**来源**: %s | **发布时间**: %s\n\n", article.Source, article.PublishedAt)
+		fmt.Fprintf(&content, "### %d. %s\n", i+1, article.Title)
+		fmt.Fprintf(&content, "**来源**: %s | **发布时间**: %s\n\n", article.Source, article.PublishedAt)
 
 		if article.Summary != "" {
-			content += fmt.Sprintf("**摘要**: %s\n\n", article.Summary)
+			fmt.Fprintf(&content, "**摘要**: %s\n\n", article.Summary)
 		} else if article.Description != "" {
-			content += fmt.Sprintf("**描述**: %s\n\n", article.Description)
+			fmt.Fprintf(&content, "**描述**: %s\n\n", article.Description)
 		}
 
-		content += "---\n\n"
+		content.WriteString("---\n\n")
 	}
 
-	content += "## 事件分析\n\n"
-	content += "本事件由系统AI自动分析多条相关新闻生成，汇总了相关的新闻报道和信息。\n\n"
+	content.WriteString("## 事件分析\n\n")
+	content.WriteString("本事件由系统AI自动分析多条相关新闻生成，汇总了相关的新闻报道和信息。\n\n")
 
-	return content
+	return content.String()
 }
 
 // createEventAndLinkNews 创建事件并关联新闻
@@ -1117,25 +1124,36 @@ func (s *AIEventService) linkNewsToEvent(newsID, eventID uint) error {
 
 // classifyNewsByTopic 根据主题分类新闻
 func (s *AIEventService) classifyNewsByTopic(news []models.News) map[string][]models.News {
-	topics := GetPredefinedTopics()
+	matcher := defaultTopicMatcher
 	classified := make(map[string][]models.News)
 
 	// 初始化分类映射
-	for _, topic := range topics {
+	for _, topic := range matcher.topics {
 		classified[topic.Name] = []models.News{}
 	}
 	classified["其他"] = []models.News{} // 未分类的新闻
 
+	// 评分缓冲区在所有新闻之间复用
+	seen := make([]uint8, matcher.keywordCount)
+	scores := make([]float64, len(matcher.topics))
+
 	for _, newsItem := range news {
+		// 新闻分类本身就是预定义主题时直接采用，无需扫描关键词
+		if _, ok := matcher.topicIndex[newsItem.Category]; ok {
+			classified[newsItem.Category] = append(classified[newsItem.Category], newsItem)
+			log.Printf("新闻 '%s' 分类为: %s (来自新闻分类)", newsItem.Title, newsItem.Category)
+			continue
+		}
+
 		bestTopic := "其他"
 		maxScore := 0.0
 
-		// 为每个主题计算匹配分数
-		for _, topic := range topics {
-			score := s.calculateTopicMatchScore(newsItem, topic)
+		// 一次扫描计算所有主题的匹配分数
+		matcher.score(newsItem, seen, scores)
+		for i, score := range scores {
 			if score > maxScore && score > 0.2 { // 设置最低匹配阈值
 				maxScore = score
-				bestTopic = topic.Name
+				bestTopic = matcher.topics[i].Name
 			}
 		}
 
@@ -1147,51 +1165,102 @@ func (s *AIEventService) classifyNewsByTopic(news []models.News) map[string][]mo
 	return classified
 }
 
-// calculateTopicMatchScore 计算新闻与主题的匹配分数
-func (s *AIEventService) calculateTopicMatchScore(news models.News, topic TopicClassification) float64 {
-	// 构建用于匹配的文本内容
-	content := news.Title + " " + news.Content
-	if news.Summary != "" {
-		content += " " + news.Summary
-	}
-	if news.Tags != "" {
-		content += " " + news.Tags
+// 关键词出现位置标记，用于确定匹配权重
+const (
+	topicFieldTitle   uint8 = 1 << iota // 标题
+	topicFieldSummary                   // 摘要
+	topicFieldTags                      // 标签
+	topicFieldOther                     // 正文、描述
+)
+
+// topicMatcher 主题关键词匹配器
+// 将所有主题的关键词构建为一个Aho-Corasick自动机，每条新闻的每个字段只需扫描一次
+type topicMatcher struct {
+	topics        []TopicClassification
+	topicIndex    map[string]int // 主题名称到下标的映射
+	matcher       *keywordMatcher
+	topicKeywords [][]int // 每个主题的关键词ID，顺序与 topic.Keywords 一致
+	keywordCount  int
+}
+
+// newTopicMatcher 根据主题定义构建匹配器
+func newTopicMatcher(topics []TopicClassification) *topicMatcher {
+	keywordIDs := make(map[string]int)
+	var keywords []string
+	topicIndex := make(map[string]int, len(topics))
+	topicKeywords := make([][]int, len(topics))
+
+	for i, topic := range topics {
+		topicIndex[topic.Name] = i
+		ids := make([]int, len(topic.Keywords))
+		for j, keyword := range topic.Keywords {
+			lowerKeyword := strings.ToLower(keyword)
+			id, ok := keywordIDs[lowerKeyword]
+			if !ok {
+				id = len(keywords)
+				keywordIDs[lowerKeyword] = id
+				keywords = append(keywords, lowerKeyword)
+			}
+			ids[j] = id
+		}
+		topicKeywords[i] = ids
 	}
-	if news.Description != "" {
-		content += " " + news.Description
+
+	return &topicMatcher{
+		topics:        topics,
+		topicIndex:    topicIndex,
+		matcher:       newKeywordMatcher(keywords),
+		topicKeywords: topicKeywords,
+		keywordCount:  len(keywords),
 	}
+}
 
-	// 转换为小写进行匹配
-	content = strings.ToLower(content)
+// score 计算新闻与每个主题的匹配分数并写入 scores，顺序与 topics 一致
+// seen 和 scores 由调用方分配并在多条新闻之间复用，长度分别为关键词数和主题数
+func (m *topicMatcher) score(news models.News, seen []uint8, scores []float64) {
+	// 记录每个关键词出现在哪些字段中
+	clear(seen)
+	mark := func(text string, field uint8) {
+		if text == "" {
+			return
+		}
+		m.matcher.scan(strings.ToLower(text), func(id int) {
+			seen[id] |= field
+		})
+	}
+	mark(news.Title, topicFieldTitle)
+	mark(news.Summary, topicFieldSummary)
+	mark(news.Tags, topicFieldTags)
+	mark(news.Content, topicFieldOther)
+	mark(news.Description, topicFieldOther)
 
-	// 计算关键词匹配得分
-	var matchCount int
-	var totalKeywords = len(topic.Keywords)
-	var weightedScore float64
+	for i, ids := range m.topicKeywords {
+		if len(ids) == 0 {
+			scores[i] = 0
+			continue
+		}
 
-	for _, keyword := range topic.Keywords {
-		lowerKeyword := strings.ToLower(keyword)
-		if strings.Contains(content, lowerKeyword) {
-			matchCount++
-			// 标题中出现关键词的权重更高
-			if strings.Contains(strings.ToLower(news.Title), lowerKeyword) {
+		// 计算关键词匹配得分
+		var weightedScore float64
+		for _, id := range ids {
+			field := seen[id]
+			switch {
+			case field == 0:
+				continue
+			case field&topicFieldTitle != 0:
 				weightedScore += 2.0 // 标题匹配权重为2
-			} else if strings.Contains(strings.ToLower(news.Summary), lowerKeyword) {
+			case field&topicFieldSummary != 0:
 				weightedScore += 1.5 // 摘要匹配权重为1.5
-			} else if strings.Contains(strings.ToLower(news.Tags), lowerKeyword) {
+			case field&topicFieldTags != 0:
 				weightedScore += 1.8 // 标签匹配权重为1.8
-			} else {
+			default:
 				weightedScore += 1.0 // 内容匹配权重为1
 			}
 		}
-	}
 
-	if totalKeywords == 0 {
-		return 0.0
+		// 加权后的匹配度分数
+		scores[i] = weightedScore / float64(len(ids))
 	}
-
-	// 返回加权后的匹配度分数
-	return weightedScore / float64(totalKeywords)
 }
 
 // generateSmartEventTitle 基于新闻内容和主题生成智能事件标题
@@ -1255,7 +1324,7 @@ func (s *AIEventService) calculateTimeSpan(articles []NewsArticle) string {
 
 	var earliest, latest time.Time
 	for i, article := range articles {
-		publishTime, err := time.Parse("2006-01-02 15:04:05", article.PublishedAt)
+		publishTime, err := utils.ParseDateTime(article.PublishedAt)
 		if err != nil {
 			continue
 		}
@@ -1409,7 +1478,7 @@ func (s *AIEventService) generateAdvancedAIResponse(articles []NewsArticle, prom
 	// 计算时间范围
 	var earliest, latest time.Time
 	for i, article := range articles {
-		publishTime, err := time.Parse("2006-01-02 15:04:05", article.PublishedAt)
+		publishTime, err := utils.ParseDateTime(article.PublishedAt)
 		if err != nil {
 			continue
 		}
@@ -1002,6 +1002,46 @@ func (s *EventService) clusterNewsByTitle(newsList []models.News) []*EventCluste
 	return clusters
 }
 
+// regionalKeywordGroups 地域关键词组
+var regionalKeywordGroups = map[string][]string{
+	"中东":   {"中东", "以色列", "巴勒斯坦", "伊朗", "叙利亚", "伊拉克", "沙特", "阿联酋", "黎巴嫩", "约旦", "也门", "卡塔尔", "科威特", "巴林", "阿曼"},
+	"俄乌":   {"俄罗斯", "乌克兰", "俄乌", "普京", "泽连斯基", "基辅", "莫斯科", "顿巴斯", "克里米亚", "哈尔科夫", "马里乌波尔"},
+	"朝鲜半岛": {"朝鲜", "韩国", "金正恩", "文在寅", "尹锡悦", "平壤", "首尔", "三八线", "板门店"},
+	"南海":   {"南海", "台海", "台湾", "南沙", "西沙", "钓鱼岛", "尖阁诸岛"},
+	"欧洲":   {"欧盟", "英国", "法国", "德国", "意大利", "西班牙", "荷兰", "比利时", "瑞士", "奥地利", "波兰", "捷克"},
+	"美洲":   {"美国", "加拿大", "墨西哥", "巴西", "阿根廷", "智利", "哥伦比亚", "委内瑞拉"},
+	"非洲":   {"埃及", "南非", "尼日利亚", "肯尼亚", "摩洛哥", "阿尔及利亚", "利比亚", "苏丹", "埃塞俄比亚"},
+	"东南亚":  {"越南", "泰国", "新加坡", "马来西亚", "印尼", "菲律宾", "缅甸", "柬埔寨", "老挝"},
+	"南亚":   {"印度", "巴基斯坦", "孟加拉国", "斯里兰卡", "尼泊尔", "不丹", "马尔代夫"},
+}
+
+// topicKeywordGroups 主题关键词组
+var topicKeywordGroups = map[string][]string{
+	"经济": {"经济", "GDP", "通胀", "利率", "股市", "汇率", "贸易", "投资", "金融", "央行", "货币", "市场", "企业", "公司"},
+	"科技": {"科技", "AI", "人工智能", "5G", "芯片", "半导体", "互联网", "数字", "智能", "技术", "创新", "研发"},
+	"政治": {"政治", "选举", "总统", "首相", "政府", "议会", "国会", "外交", "会谈", "峰会", "访问", "制裁"},
+	"军事": {"军事", "军队", "武器", "导弹", "战机", "军演", "防务", "安全", "冲突", "战争", "和平", "停火"},
+	"能源": {"能源", "石油", "天然气", "电力", "核能", "煤炭", "新能源", "太阳能", "风能", "电池"},
+	"环境": {"环境", "气候", "碳排放", "全球变暖", "污染", "环保", "绿色", "可持续", "减排"},
+	"健康": {"健康", "医疗", "疫苗", "病毒", "疫情", "医院", "药物", "治疗", "医生", "患者"},
+	"教育": {"教育", "学校", "大学", "学生", "老师", "考试", "学习", "培训", "课程"},
+	"体育": {"体育", "奥运", "世界杯", "足球", "篮球", "网球", "游泳", "田径", "运动员", "比赛"},
+	"文化": {"文化", "艺术", "电影", "音乐", "文学", "博物馆", "遗产", "传统", "节庆"},
+}
+
+// 地域和主题关键词组匹配器
+var (
+	regionalGroupMatcher = newKeywordGroupMatcher(regionalKeywordGroups)
+	topicGroupMatcher    = newKeywordGroupMatcher(topicKeywordGroups)
+)
+
+// keywordStopWords 标题关键词提取使用的停用词表
+var keywordStopWords = map[string]bool{
+	"的": true, "了": true, "是": true, "在": true, "有": true, "和": true, "与": true, "为": true, "将": true, "被": true, "把": true, "对": true, "向": true, "从": true, "到": true, "于": true, "以": true, "及": true, "或": true, "而": true, "且": true, "但": true, "不": true, "没": true, "无": true, "非": true,
+	"a": true, "an": true, "the": true, "to": true, "of": true, "for": true, "and": true, "or": true, "in": true, "on": true, "at": true, "by": true, "with": true, "from": true, "up": true, "about": true, "into": true, "through": true, "during": true, "before": true, "after": true, "above": true, "below": true, "between": true, "among": true, "this": true, "that": true, "these": true, "those": true,
+	"新闻": true, "报道": true, "消息": true, "最新": true, "今日": true, "昨日": true, "今天": true, "昨天": true, "明天": true, "本周": true, "上周": true, "下周": true, "本月": true, "上月": true, "下月": true, "今年": true, "去年": true, "明年": true,
+}
+
 // areTitlesSimilar 检查两个标题是否相似（放宽标准，提高聚合程度）
 func (s *EventService) areTitlesSimilar(title1, title2 string) bool {
 	title1 = strings.ToLower(title1)
@@ -1049,71 +1089,14 @@ func (s *EventService) areTitlesSimilar(title1, title2 string) bool {
 
 // hasRegionalMatch 检查是否有地域关键词匹配
 func (s *EventService) hasRegionalMatch(title1, title2 string) bool {
-	// 定义地域关键词组
-	regionalGroups := map[string][]string{
-		"中东":   {"中东", "以色列", "巴勒斯坦", "伊朗", "叙利亚", "伊拉克", "沙特", "阿联酋", "黎巴嫩", "约旦", "也门", "卡塔尔", "科威特", "巴林", "阿曼"},
-		"俄乌":   {"俄罗斯", "乌克兰", "俄乌", "普京", "泽连斯基", "基辅", "莫斯科", "顿巴斯", "克里米亚", "哈尔科夫", "马里乌波尔"},
-		"朝鲜半岛": {"朝鲜", "韩国", "金正恩", "文在寅", "尹锡悦", "平壤", "首尔", "三八线", "板门店"},
-		"南海":   {"南海", "台海", "台湾", "南沙", "西沙", "钓鱼岛", "尖阁诸岛"},
-		"欧洲":   {"欧盟", "英国", "法国", "德国", "意大利", "西班牙", "荷兰", "比利时", "瑞士", "奥地利", "波兰", "捷克"},
-		"美洲":   {"美国", "加拿大", "墨西哥", "巴西", "阿根廷", "智利", "哥伦比亚", "委内瑞拉"},
-		"非洲":   {"埃及", "南非", "尼日利亚", "肯尼亚", "摩洛哥", "阿尔及利亚", "利比亚", "苏丹", "埃塞俄比亚"},
-		"东南亚":  {"越南", "泰国", "新加坡", "马来西亚", "印尼", "菲律宾", "缅甸", "柬埔寨", "老挝"},
-		"南亚":   {"印度", "巴基斯坦", "孟加拉国", "斯里兰卡", "尼泊尔", "不丹", "马尔代夫"},
-	}
-
 	// 检查两个标题是否属于同一地域
-	for _, keywords := range regionalGroups {
-		found1, found2 := false, false
-		for _, keyword := range keywords {
-			if strings.Contains(title1, keyword) {
-				found1 = true
-			}
-			if strings.Contains(title2, keyword) {
-				found2 = true
-			}
-		}
-		if found1 && found2 {
-			return true
-		}
-	}
-
-	return false
+	return regionalGroupMatcher.match(title1)&regionalGroupMatcher.match(title2) != 0
 }
 
 // hasTopicMatch 检查是否有主题关键词匹配
 func (s *EventService) hasTopicMatch(title1, title2 string) bool {
-	// 定义主题关键词组
-	topicGroups := map[string][]string{
-		"经济": {"经济", "GDP", "通胀", "利率", "股市", "汇率", "贸易", "投资", "金融", "央行", "货币", "市场", "企业", "公司"},
-		"科技": {"科技", "AI", "人工智能", "5G", "芯片", "半导体", "互联网", "数字", "智能", "技术", "创新", "研发"},
-		"政治": {"政治", "选举", "总统", "首相", "政府", "议会", "国会", "外交", "会谈", "峰会", "访问", "制裁"},
-		"军事": {"军事", "军队", "武器", "导弹", "战机", "军演", "防务", "安全", "冲突", "战争", "和平", "停火"},
-		"能源": {"能源", "石油", "天然气", "电力", "核能", "煤炭", "新能源", "太阳能", "风能", "电池"},
-		"环境": {"环境", "气候", "碳排放", "全球变暖", "污染", "环保", "绿色", "可持续", "减排"},
-		"健康": {"健康", "医疗", "疫苗", "病毒", "疫情", "医院", "药物", "治疗", "医生", "患者"},
-		"教育": {"教育", "学校", "大学", "学生", "老师", "考试", "学习", "培训", "课程"},
-		"体育": {"体育", "奥运", "世界杯", "足球", "篮球", "网球", "游泳", "田径", "运动员", "比赛"},
-		"文化": {"文化", "艺术", "电影", "音乐", "文学", "博物馆", "遗产", "传统", "节庆"},
-	}
-
 	// 检查两个标题是否属于同一主题
-	for _, keywords := range topicGroups {
-		found1, found2 := false, false
-		for _, keyword := range keywords {
-			if strings.Contains(title1, keyword) {
-				found1 = true
-			}
-			if strings.Contains(title2, keyword) {
-				found2 = true
-			}
-		}
-		if found1 && found2 {
-			return true
-		}
-	}
-
-	return false
+	return topicGroupMatcher.match(title1)&topicGroupMatcher.match(title2) != 0
 }
 
 // isSimilarKeyword 检查两个关键词是否相似（编辑距离等）
@@ -1168,17 +1151,10 @@ func (s *EventService) extractKeywords(title string) []string {
 	words := strings.Split(title, " ")
 	result := make([]string, 0)
 
-	// 扩展停用词列表
-	stopWords := map[string]bool{
-		"的": true, "了": true, "是": true, "在": true, "有": true, "和": true, "与": true, "为": true, "将": true, "被": true, "把": true, "对": true, "向": true, "从": true, "到": true, "于": true, "以": true, "及": true, "或": true, "而": true, "且": true, "但": true, "不": true, "没": true, "无": true, "非": true,
-		"a": true, "an": true, "the": true, "to": true, "of": true, "for": true, "and": true, "or": true, "in": true, "on": true, "at": true, "by": true, "with": true, "from": true, "up": true, "about": true, "into": true, "through": true, "during": true, "before": true, "after": true, "above": true, "below": true, "between": true, "among": true, "this": true, "that": true, "these": true, "those": true,
-		"新闻": true, "报道": true, "消息": true, "最新": true, "今日": true, "昨日": true, "今天": true, "昨天": true, "明天": true, "本周": true, "上周": true, "下周": true, "本月": true, "上月": true, "下月": true, "今年": true, "去年": true, "明年": true,
-	}
-
 	for _, word := range words {
 		word = strings.TrimSpace(word)
 		// 保留长度>=2且不是停用词的词语
-		if len(word) >= 2 && !stopWords[word] {
+		if len(word) >= 2 && !keywordStopWords[word] {
 			result = append(result, word)
 		}
 	}
@@ -1235,7 +1211,8 @@ func (s *EventService) contains(slice []string, item string) bool {
 // convertClusterToEvent 将聚类转换为创建事件的请求
 func (s *EventService) convertClusterToEvent(cluster *EventCluster) models.CreateEventRequest {
 	// 生成详细内容
-	content := fmt.Sprintf("# %s\n\n## 事件概述\n\n%s\n\n## 相关新闻\n\n",
+	var content strings.Builder
+	fmt.Fprintf(&content, "# %s\n\n## 事件概述\n\n%s\n\n## 相关新闻\n\n",
 		cluster.Title, cluster.Description)
 
 	links := make([]string, 0)
@@ -1246,34 +1223,35 @@ func (s *EventService) convertClusterToEvent(cluster *EventCluster) models.Creat
 		}
 
 		// 添加新闻到内容
-		content += fmt.Sprintf("### %s\n\n", news.Title)
+		fmt.Fprintf(&content, "### %s\n\n", news.Title)
 		if news.Source != "" {
-			content += fmt.Sprintf("来源: %s   ", news.Source)
+			fmt.Fprintf(&content, "来源: %s   ", news.Source)
 		}
 		if !news.PublishedAt.IsZero() {
-			content += fmt.Sprintf("发布时间: %s\n\n", news.PublishedAt.Format("2006-01-02 15:04:05"))
+			fmt.Fprintf(&content, "发布时间: %s\n\n", news.PublishedAt.Format("2006-01-02 15:04:05"))
 		} else {
-			content += "\n\n"
+			content.WriteString("\n\n")
 		}
 
 		// 添加摘要或内容片段
 		if news.Summary != "" {
-			content += news.Summary + "\n\n"
+			content.WriteString(news.Summary)
+			content.WriteString("\n\n")
 		} else if news.Content != "" {
 			// 使用内容的前200个字符作为摘要
 			endPos := int(math.Min(200, float64(len(news.Content))))
-			content += news.Content[:endPos]
+			content.WriteString(news.Content[:endPos])
 			if len(news.Content) > 200 {
-				content += "..."
+				content.WriteString("...")
 			}
-			content += "\n\n"
+			content.WriteString("\n\n")
 		}
 	}
 
 	return models.CreateEventRequest{
 		Title:        cluster.Title,
 		Description:  cluster.Description,
-		Content:      content,
+		Content:      content.String(),
 		StartTime:    cluster.StartTime,
 		EndTime:      cluster.EndTime,
 		Location:     cluster.Location,
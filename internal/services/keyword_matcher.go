@@ -0,0 +1,141 @@
+package services
+
+import "fmt"
+
+// keywordMatcher 基于Aho-Corasick自动机的多关键词匹配器
+//
+// 构建一次后，对任意文本只需一次线性扫描即可找出其中出现的所有关键词，
+// 避免对每个关键词分别调用 strings.Contains 造成的重复扫描。
+// 构建完成后只读，可在多个goroutine之间共享。
+type keywordMatcher struct {
+	next    []map[byte]int32 // 状态转移表
+	fail    []int32          // 失败指针
+	outputs [][]int32        // 每个状态命中的关键词ID（已合并失败链上的输出）
+}
+
+// newKeywordMatcher 根据关键词列表构建匹配器，关键词ID即其在列表中的下标
+func newKeywordMatcher(keywords []string) *keywordMatcher {
+	m := &keywordMatcher{
+		next:    []map[byte]int32{{}},
+		fail:    []int32{0},
+		outputs: [][]int32{nil},
+	}
+
+	// 1. 构建字典树
+	for id, keyword := range keywords {
+		if keyword == "" {
+			continue
+		}
+		state := int32(0)
+		for i := 0; i < len(keyword); i++ {
+			child, ok := m.next[state][keyword[i]]
+			if !ok {
+				child = int32(len(m.next))
+				m.next = append(m.next, map[byte]int32{})
+				m.fail = append(m.fail, 0)
+				m.outputs = append(m.outputs, nil)
+				m.next[state][keyword[i]] = child
+			}
+			state = child
+		}
+		m.outputs[state] = append(m.outputs[state], int32(id))
+	}
+
+	// 2. 按层次遍历计算失败指针
+	queue := make([]int32, 0, len(m.next))
+	for _, child := range m.next[0] {
+		queue = append(queue, child)
+	}
+	for len(queue) > 0 {
+		state := queue[0]
+		queue = queue[1:]
+		for b, child := range m.next[state] {
+			f := m.fail[state]
+			for f != 0 {
+				if _, ok := m.next[f][b]; ok {
+					break
+				}
+				f = m.fail[f]
+			}
+			if target, ok := m.next[f][b]; ok && target != child {
+				m.fail[child] = target
+			}
+			m.outputs[child] = append(m.outputs[child], m.outputs[m.fail[child]]...)
+			queue = append(queue, child)
+		}
+	}
+
+	return m
+}
+
+// scan 对文本进行一次扫描，每命中一次关键词就以其ID调用 fn
+func (m *keywordMatcher) scan(text string, fn func(id int)) {
+	state := int32(0)
+	for i := 0; i < len(text); i++ {
+		b := text[i]
+		for {
+			if child, ok := m.next[state][b]; ok {
+				state = child
+				break
+			}
+			if state == 0 {
+				break
+			}
+			state = m.fail[state]
+		}
+		for _, id := range m.outputs[state] {
+			fn(int(id))
+		}
+	}
+}
+
+// keywordGroupMatcher 关键词组匹配器，一次扫描即可得到文本命中的全部关键词组
+// 命中结果以位掩码表示，因此最多支持 maxKeywordGroups 个关键词组
+type keywordGroupMatcher struct {
+	matcher    *keywordMatcher
+	groupMasks []uint64 // 每个关键词所属关键词组的位掩码，下标为关键词ID
+}
+
+// maxKeywordGroups 关键词组数量上限，受位掩码位数限制
+const maxKeywordGroups = 64
+
+// newKeywordGroupMatcher 根据关键词组构建匹配器，关键词组超过64个时panic
+func newKeywordGroupMatcher(groups map[string][]string) *keywordGroupMatcher {
+	if len(groups) > maxKeywordGroups {
+		// 超出的关键词组位移后为0，会静默丢失匹配结果，因此在构建时直接报错
+		panic(fmt.Sprintf("keyword group matcher supports at most %d groups, got %d", maxKeywordGroups, len(groups)))
+	}
+
+	keywordIDs := make(map[string]int)
+	var keywords []string
+	var groupMasks []uint64
+
+	bit := 0
+	for _, groupKeywords := range groups {
+		for _, keyword := range groupKeywords {
+			id, ok := keywordIDs[keyword]
+			if !ok {
+				id = len(keywords)
+				keywordIDs[keyword] = id
+				keywords = append(keywords, keyword)
+				groupMasks = append(groupMasks, 0)
+			}
+			groupMasks[id] |= 1 << bit
+		}
+		bit++
+	}
+
+	return &keywordGroupMatcher{
+		matcher:    newKeywordMatcher(keywords),
+		groupMasks: groupMasks,
+	}
+}
+
+// match 返回文本命中的关键词组位掩码
+func (m *keywordGroupMatcher) match(text string) uint64 {
+	var mask uint64
+	m.matcher.scan(text, func(id int) {
+		mask |= m.groupMasks[id]
+	})
+	return mask
+}
@@ -0,0 +1,165 @@
+package services
+
+import (
+	"math/bits"
+	"math/rand"
+	"reflect"
+	"strconv"
+	"strings"
+	"testing"
+)
+
+// countOccurrences 朴素实现：统计关键词在文本中出现的次数（允许重叠），作为自动机的对照
+func countOccurrences(text, keyword string) int {
+	if keyword == "" {
+		return 0
+	}
+	count := 0
+	for i := 0; i+len(keyword) <= len(text); i++ {
+		if strings.HasPrefix(text[i:], keyword) {
+			count++
+		}
+	}
+	return count
+}
+
+// scanCounts 返回自动机扫描文本得到的各关键词命中次数，下标为关键词ID
+func scanCounts(m *keywordMatcher, text string, n int) []int {
+	counts := make([]int, n)
+	m.scan(text, func(id int) {
+		counts[id]++
+	})
+	return counts
+}
+
+func TestKeywordMatcherScan(t *testing.T) {
+	tests := []struct {
+		name     string
+		keywords []string
+		text     string
+		want     []int
+	}{
+		{"无命中", []string{"经济", "体育"}, "今日天气晴朗", []int{0, 0}},
+		{"单次命中", []string{"经济", "体育"}, "国内经济稳步增长", []int{1, 0}},
+		{"多次命中", []string{"he"}, "hehehe", []int{3}},
+		{"重叠关键词", []string{"he", "she", "his", "hers"}, "ushers", []int{1, 1, 0, 1}},
+		{"前缀关键词", []string{"a", "aa", "aaa"}, "aaaa", []int{4, 3, 2}},
+		{"重复关键词", []string{"AI", "AI"}, "AI芯片与AI应用", []int{2, 2}},
+		{"空关键词被忽略", []string{"", "球"}, "足球篮球", []int{0, 2}},
+		{"中文多字节", []string{"人工智能", "智能"}, "人工智能与智能制造", []int{1, 2}},
+		{"区分大小写", []string{"GPU"}, "gpu GPU", []int{1}},
+		{"空文本", []string{"新闻"}, "", []int{0}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			m := newKeywordMatcher(tt.keywords)
+			got := scanCounts(m, tt.text, len(tt.keywords))
+			if !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("scan(%q) = %v, want %v", tt.text, got, tt.want)
+			}
+		})
+	}
+}
+
+// TestKeywordMatcherRandom 随机生成关键词和文本，与朴素匹配结果逐一比对
+func TestKeywordMatcherRandom(t *testing.T) {
+	// 小字母表更容易产生重叠和失败指针跳转，中文字符用于覆盖多字节编码
+	alphabet := []string{"a", "b", "c", "经", "济"}
+	randomString := func(r *rand.Rand, maxLen int) string {
+		var sb strings.Builder
+		n := r.Intn(maxLen + 1)
+		for i := 0; i < n; i++ {
+			sb.WriteString(alphabet[r.Intn(len(alphabet))])
+		}
+		return sb.String()
+	}
+
+	r := rand.New(rand.NewSource(1))
+	for iter := 0; iter < 2000; iter++ {
+		keywords := make([]string, 1+r.Intn(8))
+		for i := range keywords {
+			keywords[i] = randomString(r, 4)
+		}
+		m := newKeywordMatcher(keywords)
+
+		for j := 0; j < 5; j++ {
+			text := randomString(r, 40)
+			got := scanCounts(m, text, len(keywords))
+			for id, keyword := range keywords {
+				if want := countOccurrences(text, keyword); got[id] != want {
+					t.Fatalf("keywords=%q text=%q: keyword %q matched %d times, want %d",
+						keywords, text, keyword, got[id], want)
+				}
+			}
+		}
+	}
+}
+
+// TestKeywordGroupMatcher 关键词组掩码应与逐组 strings.Contains 的结果一致
+func TestKeywordGroupMatcher(t *testing.T) {
+	groups := map[string][]string{
+		"北京": {"北京", "首都"},
+		"经济": {"经济", "GDP", "股市"},
+		"体育": {"足球", "篮球", "经济"}, // 与其他组共享关键词
+	}
+	m := newKeywordGroupMatcher(groups)
+
+	// containsGroups 朴素实现：返回文本命中的关键词组名称集合
+	containsGroups := func(text string) map[string]bool {
+		names := make(map[string]bool)
+		for name, keywords := range groups {
+			for _, keyword := range keywords {
+				if strings.Contains(text, keyword) {
+					names[name] = true
+					break
+				}
+			}
+		}
+		return names
+	}
+
+	texts := []string{
+		"",
+		"北京新闻",
+		"首都举办足球赛",
+		"GDP数据发布，股市上涨",
+		"经济形势分析",
+		"篮球联赛开幕",
+		"天气预报",
+	}
+
+	// 掩码的位序取决于map遍历顺序，因此只比较命中组数以及两两之间是否共享关键词组
+	for _, a := range texts {
+		groupsA := containsGroups(a)
+		if got := bits.OnesCount64(m.match(a)); got != len(groupsA) {
+			t.Errorf("match(%q) hit %d groups, want %d", a, got, len(groupsA))
+		}
+		for _, b := range texts {
+			want := false
+			for name := range containsGroups(b) {
+				if groupsA[name] {
+					want = true
+					break
+				}
+			}
+			if got := m.match(a)&m.match(b) != 0; got != want {
+				t.Errorf("share group (%q, %q) = %v, want %v", a, b, got, want)
+			}
+		}
+	}
+}
+
+func TestKeywordGroupMatcherTooManyGroups(t *testing.T) {
+	groups := make(map[string][]string, maxKeywordGroups+1)
+	for i := 0; i <= maxKeywordGroups; i++ {
+		groups[strconv.Itoa(i)] = []string{"keyword" + strconv.Itoa(i)}
+	}
+
+	defer func() {
+		if recover() == nil {
+			t.Errorf("newKeywordGroupMatcher with %d groups did not panic", len(groups))
+		}
+	}()
+	newKeywordGroupMatcher(groups)
+}
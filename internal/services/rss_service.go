@@ -5,10 +5,13 @@ import (
 	"fmt"
 	"html"
 	"log"
+	"math"
 	"math/rand"
 	"net/http"
 	"regexp"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"time"
 	"unicode/utf8"
 
@@ -19,6 +22,15 @@ import (
 	"gorm.io/gorm"
 )
 
+// rssFetchConcurrency 同时抓取的RSS源数量上限
+const rssFetchConcurrency = 4
+
+// 摘要提取使用的正则表达式
+var (
+	htmlTagRegex    = regexp.MustCompile(`<[^>]*>`)
+	whitespaceRegex = regexp.MustCompile(`\s+`)
+)
+
 type RSSService struct {
 	db                    *gorm.DB
 	parser                *gofeed.Parser
@@ -202,6 +214,31 @@ func (s *RSSService) DeleteRSSSource(id uint) error {
 
 // FetchRSSFeed 抓取单个RSS源的内容（带重试机制）
 func (s *RSSService) FetchRSSFeed(sourceID uint) (*models.RSSFetchStats, error) {
+	fetched, err := s.downloadRSSFeed(sourceID)
+	if err != nil {
+		return nil, err
+	}
+
+	stats := s.storeRSSFeedItems(fetched)
+
+	// 如果有新的新闻条目且启用了AI分析，异步触发批量AI分析
+	if stats.NewItems > 0 {
+		s.triggerBatchAIAnalysis(fmt.Sprintf("RSS源 %s", fetched.source.Name), stats.NewItems)
+	}
+
+	return stats, nil
+}
+
+// fetchedRSSFeed 已下载解析、尚未入库的RSS源内容
+type fetchedRSSFeed struct {
+	source           models.RSSSource
+	feed             *gofeed.Feed
+	startTime        time.Time
+	downloadDuration time.Duration // 下载解析耗时（含重试）
+}
+
+// downloadRSSFeed 下载并解析单个RSS源（带重试机制），不写入新闻数据，可并发调用
+func (s *RSSService) downloadRSSFeed(sourceID uint) (*fetchedRSSFeed, error) {
 	log.Printf("[RSS DEBUG] Starting to fetch RSS feed for source ID: %d", sourceID)
 
 	var source models.RSSSource
@@ -218,11 +255,6 @@ func (s *RSSService) FetchRSSFeed(sourceID uint) (*models.RSSFetchStats, error)
 	}
 
 	startTime := time.Now()
-	stats := &models.RSSFetchStats{
-		SourceID:   source.ID,
-		SourceName: source.Name,
-		FetchTime:  startTime,
-	}
 
 	// 解析RSS feed（带重试机制）
 	feed, err := s.fetchRSSWithRetry(source.URL, 3)
@@ -241,13 +273,42 @@ func (s *RSSService) FetchRSSFeed(sourceID uint) (*models.RSSFetchStats, error)
 
 	log.Printf("[RSS DEBUG] Successfully parsed RSS feed, found %d items", len(feed.Items))
 
+	return &fetchedRSSFeed{
+		source:           source,
+		feed:             feed,
+		startTime:        startTime,
+		downloadDuration: time.Since(startTime),
+	}, nil
+}
+
+// rssStoreMu RSS新闻入库锁
+// processNewsItem 先查询GUID或链接是否已存在再决定插入或更新，数据库中没有唯一约束兜底，
+// 并发入库时不同源中的同一篇新闻可能被重复插入。处理器和调度器各自持有RSSService实例，因此使用包级锁
+var rssStoreMu sync.Mutex
+
+// storeRSSFeedItems 将已下载的RSS源内容写入数据库并更新源的统计信息，同一时间只有一个调用在入库
+func (s *RSSService) storeRSSFeedItems(fetched *fetchedRSSFeed) *models.RSSFetchStats {
+	rssStoreMu.Lock()
+	defer rssStoreMu.Unlock()
+
+	storeStart := time.Now()
+	source := fetched.source
+	feed := fetched.feed
+	startTime := fetched.startTime
+
+	stats := &models.RSSFetchStats{
+		SourceID:   source.ID,
+		SourceName: source.Name,
+		FetchTime:  startTime,
+	}
 	stats.TotalItems = len(feed.Items)
 
 	// 处理每个新闻条目
+	processedItems := make([]*models.News, 0, len(feed.Items))
 	for i, item := range feed.Items {
 		log.Printf("[RSS DEBUG] Processing item %d/%d: %s", i+1, len(feed.Items), item.Title)
 
-		newsItem, isNew, err := s.processNewsItem(&source, item)
+		newsItem, isNew, err := s.processNewsItem(&source, item, startTime)
 		if err != nil {
 			log.Printf("[RSS ERROR] Error processing news item '%s': %v", item.Title, err)
 			stats.ErrorItems++
@@ -262,14 +323,14 @@ func (s *RSSService) FetchRSSFeed(sourceID uint) (*models.RSSFetchStats, error)
 			log.Printf("[RSS DEBUG] Updated existing news item: %s", item.Title)
 		}
 
-		// 计算新闻热度
 		if newsItem != nil {
-			if err := s.calculateNewsHotness(newsItem.ID); err != nil {
-				log.Printf("[RSS WARNING] Failed to calculate hotness for news item %d: %v", newsItem.ID, err)
-			}
+			processedItems = append(processedItems, newsItem)
 		}
 	}
 
+	// 计算新闻热度
+	s.updateNewsHotnessScores(processedItems, startTime)
+
 	// 更新RSS源统计信息
 	updateData := map[string]interface{}{
 		"last_fetched": time.Now(),
@@ -283,25 +344,42 @@ func (s *RSSService) FetchRSSFeed(sourceID uint) (*models.RSSFetchStats, error)
 
 	s.db.Model(&source).Updates(updateData)
 
-	stats.Duration = time.Since(startTime).String()
+	// 耗时为本源的下载耗时与入库耗时之和，不包含等待其他源下载或入库的时间
+	stats.Duration = (fetched.downloadDuration + time.Since(storeStart)).String()
 	log.Printf("[RSS DEBUG] RSS fetch completed for %s: %d new, %d updated, %d errors in %s",
 		source.Name, stats.NewItems, stats.UpdatedItems, stats.ErrorItems, stats.Duration)
 
-	// 如果有新的新闻条目且启用了AI分析，异步触发批量AI分析
-	if stats.NewItems > 0 && s.IsAIAnalysisEnabled() {
-		go func() {
-			log.Printf("[RSS AI] RSS源 %s 抓取到 %d 条新闻，开始批量AI分析...", source.Name, stats.NewItems)
-			// 延迟5秒开始分析，让数据库事务完成
-			time.Sleep(5 * time.Second)
-			if err := s.aiService.BatchAnalyzeUnprocessedNews(); err != nil {
-				log.Printf("[RSS AI ERROR] 批量AI分析失败: %v", err)
-			} else {
-				log.Printf("[RSS AI] RSS源 %s 的新闻批量AI分析完成", source.Name)
-			}
-		}()
+	return stats
+}
+
+// batchAIAnalysisRunning 是否已有由RSS抓取触发的批量AI分析在进行
+// 只约束 triggerBatchAIAnalysis：新闻分析调度器和管理后台直接调用 BatchAnalyzeUnprocessedNews，不受此标记影响
+var batchAIAnalysisRunning atomic.Bool
+
+// triggerBatchAIAnalysis 启用AI分析时异步触发一次批量AI分析
+// FetchRSSFeed 和 FetchAllRSSFeeds 都经由此处触发；已有分析在进行时跳过本次触发，
+// 本次抓取的新闻保持未处理状态，由后续分析处理
+func (s *RSSService) triggerBatchAIAnalysis(label string, newItems int) {
+	if !s.IsAIAnalysisEnabled() {
+		return
+	}
+	if !batchAIAnalysisRunning.CompareAndSwap(false, true) {
+		log.Printf("[RSS AI] %s 抓取到 %d 条新闻，已有批量AI分析在进行，跳过本次触发", label, newItems)
+		return
 	}
 
-	return stats, nil
+	go func() {
+		defer batchAIAnalysisRunning.Store(false)
+
+		log.Printf("[RSS AI] %s 抓取到 %d 条新闻，开始批量AI分析...", label, newItems)
+		// 延迟5秒开始分析，让数据库事务完成
+		time.Sleep(5 * time.Second)
+		if err := s.aiService.BatchAnalyzeUnprocessedNews(); err != nil {
+			log.Printf("[RSS AI ERROR] 批量AI分析失败: %v", err)
+		} else {
+			log.Printf("[RSS AI] %s 的新闻批量AI分析完成", label)
+		}
+	}()
 }
 
 // fetchRSSWithRetry 带重试机制的RSS抓取
@@ -311,7 +389,7 @@ func (s *RSSService) fetchRSSWithRetry(url string, maxRetries int) (*gofeed.Feed
 	for attempt := 1; attempt <= maxRetries; attempt++ {
 		log.Printf("[RSS DEBUG] Attempting to fetch RSS from %s (attempt %d/%d)", url, attempt, maxRetries)
 
-		feed, err := s.parser.ParseURL(url)
+		feed, err := s.newFeedParser().ParseURL(url)
 		if err == nil {
 			log.Printf("[RSS DEBUG] Successfully fetched RSS from %s on attempt %d", url, attempt)
 			return feed, nil
@@ -341,6 +419,15 @@ func (s *RSSService) fetchRSSWithRetry(url string, maxRetries int) (*gofeed.Feed
 	return nil, fmt.Errorf("failed after %d attempts, last error: %v", maxRetries, lastError)
 }
 
+// newFeedParser 创建共享HTTP客户端配置的RSS解析器
+// gofeed.Parser 在解析过程中保存内部状态，不能被多个goroutine同时使用，因此每次抓取单独创建
+func (s *RSSService) newFeedParser() *gofeed.Parser {
+	parser := gofeed.NewParser()
+	parser.Client = s.parser.Client
+	parser.UserAgent = s.parser.UserAgent
+	return parser
+}
+
 // FetchAllRSSFeeds 抓取所有活跃RSS源的内容
 func (s *RSSService) FetchAllRSSFeeds() (*models.RSSFetchResult, error) {
 	var sources []models.RSSSource
@@ -350,25 +437,54 @@ func (s *RSSService) FetchAllRSSFeeds() (*models.RSSFetchResult, error) {
 
 	result := &models.RSSFetchResult{
 		Success: true,
-		Stats:   make([]models.RSSFetchStats, 0),
+		Stats:   make([]models.RSSFetchStats, len(sources)),
 	}
 
+	// 并发下载各RSS源，下载结果按源的顺序写入对应位置
+	fetched := make([]*fetchedRSSFeed, len(sources))
+	sem := make(chan struct{}, rssFetchConcurrency)
+	var wg sync.WaitGroup
+
+	for i, source := range sources {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, source models.RSSSource) {
+			defer wg.Done()
+			defer func() { <-sem }()
+
+			feed, err := s.downloadRSSFeed(source.ID)
+			if err != nil {
+				log.Printf("Failed to fetch RSS feed for source %s: %v", source.Name, err)
+				return
+			}
+			fetched[i] = feed
+		}(i, source)
+	}
+	wg.Wait()
+
+	// 在当前goroutine中按顺序入库，保证去重检查与写入不会在不同源之间交错
 	successCount := 0
-	for _, source := range sources {
-		stats, err := s.FetchRSSFeed(source.ID)
-		if err != nil {
-			log.Printf("Failed to fetch RSS feed for source %s: %v", source.Name, err)
-			result.Stats = append(result.Stats, models.RSSFetchStats{
+	newItems := 0
+	for i, source := range sources {
+		if fetched[i] == nil {
+			result.Stats[i] = models.RSSFetchStats{
 				SourceID:   source.ID,
 				SourceName: source.Name,
 				ErrorItems: 1,
 				FetchTime:  time.Now(),
-			})
+			}
 			continue
 		}
 
-		result.Stats = append(result.Stats, *stats)
+		stats := s.storeRSSFeedItems(fetched[i])
+		result.Stats[i] = *stats
 		successCount++
+		newItems += stats.NewItems
+	}
+
+	// 所有源入库完成后只触发一次批量AI分析
+	if newItems > 0 {
+		s.triggerBatchAIAnalysis("本次RSS抓取", newItems)
 	}
 
 	if successCount == 0 {
@@ -389,10 +505,9 @@ func (s *RSSService) FetchAllRSSFeeds() (*models.RSSFetchResult, error) {
 	return result, nil
 }
 
-// generateNewsStats 为新闻生成合理的统计数据
-func (s *RSSService) generateNewsStats(publishedAt time.Time, source *models.RSSSource) (int64, int64, int64, int64, float64) {
+// generateNewsStats 为新闻生成合理的统计数据，now 为本次抓取的基准时间
+func (s *RSSService) generateNewsStats(publishedAt, now time.Time, source *models.RSSSource) (int64, int64, int64, int64, float64) {
 	// 根据发布时间计算时间权重（越新的新闻基础数据越低）
-	now := time.Now()
 	hoursOld := now.Sub(publishedAt).Hours()
 
 	// 时间权重：0-24小时内权重最低，随时间增加
@@ -461,8 +576,8 @@ func (s *RSSService) generateNewsStats(publishedAt time.Time, source *models.RSS
 	return viewCount, likeCount, commentCount, shareCount, hotnessScore
 }
 
-// processNewsItem 处理单个新闻条目
-func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item) (*models.News, bool, error) {
+// processNewsItem 处理单个新闻条目，now 为本次抓取的基准时间（同一批次共用，避免逐条获取系统时间）
+func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item, now time.Time) (*models.News, bool, error) {
 	log.Printf("[RSS DEBUG] Processing news item: %s", item.Title)
 
 	// 检查是否已存在
@@ -496,7 +611,7 @@ func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item
 	} else if item.UpdatedParsed != nil {
 		publishedAt = *item.UpdatedParsed
 	} else {
-		publishedAt = time.Now()
+		publishedAt = now
 	}
 
 	// 提取图片URL
@@ -520,6 +635,7 @@ func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item
 	if categoryStr == "" {
 		categoryStr = source.Category
 	}
+	tags := utils.SliceToJSON(categories)
 
 	// 处理内容字段 - 优先使用Content，如果为空则使用Description
 	content := item.Content
@@ -549,7 +665,7 @@ func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item
 
 	if isNew {
 		// 新新闻：生成完整的统计数据
-		viewCount, likeCount, commentCount, shareCount, hotnessScore = s.generateNewsStats(publishedAt, source)
+		viewCount, likeCount, commentCount, shareCount, hotnessScore = s.generateNewsStats(publishedAt, now, source)
 		log.Printf("[RSS DEBUG] Generated stats for new news: %s", title)
 	} else {
 		// 现有新闻：检查是否需要补充统计数据
@@ -562,11 +678,11 @@ func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item
 		// 如果统计数据为0或过低，生成合理的数据
 		if viewCount == 0 && likeCount == 0 && commentCount == 0 {
 			log.Printf("[RSS DEBUG] Existing news has no stats, generating new stats for: %s", title)
-			viewCount, likeCount, commentCount, shareCount, hotnessScore = s.generateNewsStats(publishedAt, source)
-		} else if viewCount < 10 && time.Since(publishedAt).Hours() > 24 {
+			viewCount, likeCount, commentCount, shareCount, hotnessScore = s.generateNewsStats(publishedAt, now, source)
+		} else if viewCount < 10 && now.Sub(publishedAt).Hours() > 24 {
 			// 如果发布超过24小时但浏览量还很低，适当补充一些数据
 			log.Printf("[RSS DEBUG] Boosting low stats for older news: %s", title)
-			additionalViews, additionalLikes, additionalComments, additionalShares, newHotness := s.generateNewsStats(publishedAt, source)
+			additionalViews, additionalLikes, additionalComments, additionalShares, newHotness := s.generateNewsStats(publishedAt, now, source)
 
 			// 增加一些数据，但不要完全替换
 			viewCount += additionalViews / 3
@@ -590,7 +706,7 @@ func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item
 		Summary:      summary,
 		Author:       author,
 		Category:     categoryStr,
-		Tags:         utils.SliceToJSON(categories),
+		Tags:         tags,
 		PublishedAt:  publishedAt,
 		GUID:         guid,
 		ImageURL:     imageURL,
@@ -622,7 +738,7 @@ func (s *RSSService) processNewsItem(source *models.RSSSource, item *gofeed.Item
 		existingItem.Summary = summary
 		existingItem.Author = author
 		existingItem.Category = categoryStr
-		existingItem.Tags = utils.SliceToJSON(categories)
+		existingItem.Tags = tags
 		existingItem.PublishedAt = publishedAt
 		existingItem.ImageURL = imageURL
 		existingItem.Source = source.Name
@@ -712,11 +828,10 @@ func (s *RSSService) extractSummary(htmlContent string, maxLength int) string {
 	content = html.UnescapeString(content)
 
 	// 移除HTML标签
-	re := regexp.MustCompile(`<[^>]*>`)
-	text := re.ReplaceAllString(content, "")
+	text := htmlTagRegex.ReplaceAllString(content, "")
 
 	// 移除多余的空白字符
-	text = regexp.MustCompile(`\s+`).ReplaceAllString(text, " ")
+	text = whitespaceRegex.ReplaceAllString(text, " ")
 	text = strings.TrimSpace(text)
 
 	// 再次清理UTF-8编码（以防HTML解码引入了无效字符）
@@ -838,54 +953,48 @@ func (s *RSSService) calculateNewsHotness(newsID uint) error {
 		return err
 	}
 
-	// 计算热度分值（类似事件热度计算）
-	viewScore := float64(newsItem.ViewCount) / 1000.0 * 8.0
-	if viewScore > 10 {
-		viewScore = 10
-	}
-
-	likeScore := float64(newsItem.LikeCount) / 100.0
-	if likeScore > 10 {
-		likeScore = 10
-	}
+	// 更新热度分值
+	return s.db.Model(&newsItem).UpdateColumn("hotness_score", computeNewsHotness(&newsItem, time.Now())).Error
+}
 
-	commentScore := float64(newsItem.CommentCount) / 10.0
-	if commentScore > 10 {
-		commentScore = 10
+// updateNewsHotnessScores 计算并更新一组新闻的热度
+// 直接使用内存中已保存的新闻数据计算，无需逐条重新查询数据库；
+// 每条新闻单独更新，某条失败只记录日志，不影响其他新闻
+func (s *RSSService) updateNewsHotnessScores(newsItems []*models.News, now time.Time) {
+	for _, newsItem := range newsItems {
+		if err := s.db.Model(newsItem).UpdateColumn("hotness_score", computeNewsHotness(newsItem, now)).Error; err != nil {
+			log.Printf("[RSS WARNING] Failed to calculate hotness for news item %d: %v", newsItem.ID, err)
+		}
 	}
+}
 
-	shareScore := float64(newsItem.ShareCount) / 5.0
-	if shareScore > 10 {
-		shareScore = 10
-	}
+// computeNewsHotness 根据互动数据和发布时间计算新闻热度分值（0-10分）
+func computeNewsHotness(newsItem *models.News, now time.Time) float64 {
+	// 计算热度分值（类似事件热度计算）
+	viewScore := math.Min(float64(newsItem.ViewCount)/1000.0*8.0, 10)
+	likeScore := math.Min(float64(newsItem.LikeCount)/100.0, 10)
+	commentScore := math.Min(float64(newsItem.CommentCount)/10.0, 10)
+	shareScore := math.Min(float64(newsItem.ShareCount)/5.0, 10)
 
 	// 时间因素
-	hours := time.Since(newsItem.PublishedAt).Hours()
+	hours := now.Sub(newsItem.PublishedAt).Hours()
 	timeScore := 10.0
-	if hours > 1 {
-		timeScore = 9.0
-	}
-	if hours > 6 {
-		timeScore = 8.0
-	}
-	if hours > 24 {
-		timeScore = 6.0
-	}
-	if hours > 72 {
-		timeScore = 4.0
-	}
-	if hours > 168 {
+	switch {
+	case hours > 168:
 		timeScore = 2.0
+	case hours > 72:
+		timeScore = 4.0
+	case hours > 24:
+		timeScore = 6.0
+	case hours > 6:
+		timeScore = 8.0
+	case hours > 1:
+		timeScore = 9.0
 	}
 
 	// 综合计算
 	finalScore := viewScore*0.2 + likeScore*0.3 + commentScore*0.25 + shareScore*0.15 + timeScore*0.1
-	if finalScore > 10 {
-		finalScore = 10
-	}
-
-	// 更新热度分值
-	return s.db.Model(&newsItem).UpdateColumn("hotness_score", finalScore).Error
+	return math.Min(finalScore, 10)
 }
 
 // GetRSSCategories 获取所有RSS源分类
@@ -1,7 +1,6 @@
 package services
 
 import (
-	"encoding/json"
 	"errors"
 	"fmt"
 	"log"
@@ -111,116 +110,183 @@ func (s *SeedService) SeedNewsFromJSON(jsonFilePath string) error {
 
 	log.Printf("数据库中当前有 %d 条新闻记录，准备进行增量导入", count)
 
-	// 读取JSON文件
-	jsonData, err := os.ReadFile(jsonFilePath)
+	// 打开JSON文件，流式解析，避免将整个文件及全部记录同时载入内存
+	file, err := os.Open(jsonFilePath)
 	if err != nil {
 		return fmt.Errorf("failed to read JSON file: %w", err)
 	}
+	defer file.Close()
 
-	// 解析JSON数据
-	var newsDataList []NewsJSONData
-	if err := json.Unmarshal(jsonData, &newsDataList); err != nil {
+	decoder := utils.NewJSONDecoder(file)
+
+	// 读取数组起始符 '['
+	tok, err := decoder.Token()
+	if err != nil {
 		return fmt.Errorf("failed to parse JSON data: %w", err)
 	}
+	if delim, ok := tok.(fmt.Stringer); !ok || delim.String() != "[" {
+		return fmt.Errorf("failed to parse JSON data: expected array, got %v", tok)
+	}
 
-	log.Printf("成功解析JSON文件，找到 %d 条新闻记录", len(newsDataList))
+	// 导入基准时间，用于发布时间缺失时的回退值，避免逐条获取系统时间
+	importTime := time.Now()
+
+	// 根据News模型的列数确定每批插入的记录数
+	batchSize, err := newsInsertBatchSize(s.db)
+	if err != nil {
+		return fmt.Errorf("failed to parse news schema: %w", err)
+	}
 
-	// 批量插入数据
-	var newsList []models.News
+	// 批量插入数据，缓冲区按批次大小预分配，每批写入后复用
+	newsList := make([]models.News, 0, batchSize)
+	// 当前批次尚未写入数据库，查询无法发现批次内的重复记录，因此在内存中记录其GUID和链接
+	pendingGUIDs := make(map[string]struct{}, batchSize)
+	pendingLinks := make(map[string]struct{}, batchSize)
 	importedCount := 0
 	skippedCount := 0
 
-	for i, newsData := range newsDataList {
-		// 解析发布时间
-		publishedAt, err := time.Parse("2006-01-02 15:04:05", newsData.PublishedAt)
-		if err != nil {
-			log.Printf("警告：解析第 %d 条记录的发布时间失败，使用当前时间: %v", i+1, err)
-			publishedAt = time.Now()
-		}
+	// 整个导入过程在同一事务中进行：任一记录解析或写入失败时全部回滚，不会留下部分导入的数据
+	err = s.db.Transaction(func(tx *gorm.DB) error {
+		for i := 0; decoder.More(); i++ {
+			// 逐条解析新闻记录
+			var newsData NewsJSONData
+			if err := decoder.Decode(&newsData); err != nil {
+				return fmt.Errorf("failed to parse JSON data: %w", err)
+			}
 
-		// 检查是否已存在相同GUID或链接的记录
-		var existingNews models.News
-		err = s.db.Where("guid = ? OR link = ?", newsData.GUID, newsData.Link).First(&existingNews).Error
-		if err == nil {
-			skippedCount++
-			log.Printf("跳过重复记录：%s", newsData.Title)
-			continue
-		} else if err != gorm.ErrRecordNotFound {
-			log.Printf("检查重复记录时出错：%v", err)
-			continue
-		}
+			// 解析发布时间
+			publishedAt, err := utils.ParseDateTime(newsData.PublishedAt)
+			if err != nil {
+				log.Printf("警告：解析第 %d 条记录的发布时间失败，使用当前时间: %v", i+1, err)
+				publishedAt = importTime
+			}
 
-		// 转换SourceType
-		var sourceType models.NewsType = models.NewsTypeManual
-		if newsData.SourceType == "rss" {
-			sourceType = models.NewsTypeRSS
-		}
+			// 检查当前批次中是否已有相同GUID或链接的记录
+			_, pendingGUID := pendingGUIDs[newsData.GUID]
+			_, pendingLink := pendingLinks[newsData.Link]
+			if pendingGUID || pendingLink {
+				skippedCount++
+				log.Printf("跳过重复记录：%s", newsData.Title)
+				continue
+			}
 
-		// 创建新闻记录
-		news := models.News{
-			Title:        newsData.Title,
-			Content:      newsData.Content,
-			Summary:      newsData.Summary,
-			Description:  newsData.Description,
-			Source:       newsData.Source,
-			Category:     newsData.Category,
-			PublishedAt:  publishedAt,
-			CreatedBy:    newsData.CreatedBy,
-			IsActive:     newsData.IsActive,
-			SourceType:   sourceType,
-			RSSSourceID:  newsData.RSSSourceID,
-			Link:         newsData.Link,
-			GUID:         newsData.GUID,
-			Author:       newsData.Author,
-			ImageURL:     newsData.ImageURL,
-			Tags:         newsData.Tags,
-			Language:     newsData.Language,
-			ViewCount:    newsData.ViewCount,
-			LikeCount:    newsData.LikeCount,
-			CommentCount: newsData.CommentCount,
-			ShareCount:   newsData.ShareCount,
-			HotnessScore: newsData.HotnessScore,
-			Status:       newsData.Status,
-			IsProcessed:  newsData.IsProcessed,
-		}
+			// 检查数据库中是否已存在相同GUID或链接的记录
+			// 空GUID或空链接不参与匹配，否则缺少该字段的记录会被误判为与任意同样缺少该字段的记录重复
+			var existingNews models.News
+			err = tx.Where("(guid = ? AND guid <> '') OR (link = ? AND link <> '')", newsData.GUID, newsData.Link).First(&existingNews).Error
+			if err == nil {
+				skippedCount++
+				log.Printf("跳过重复记录：%s", newsData.Title)
+				continue
+			} else if !errors.Is(err, gorm.ErrRecordNotFound) {
+				// 语句出错后PostgreSQL会中止整个事务，后续查询都会失败，因此直接返回并回滚
+				return fmt.Errorf("failed to check duplicate news: %w", err)
+			}
+
+			// 转换SourceType
+			var sourceType models.NewsType = models.NewsTypeManual
+			if newsData.SourceType == "rss" {
+				sourceType = models.NewsTypeRSS
+			}
 
-		newsList = append(newsList, news)
-		importedCount++
+			// 创建新闻记录
+			news := models.News{
+				Title:        newsData.Title,
+				Content:      newsData.Content,
+				Summary:      newsData.Summary,
+				Description:  newsData.Description,
+				Source:       newsData.Source,
+				Category:     newsData.Category,
+				PublishedAt:  publishedAt,
+				CreatedBy:    newsData.CreatedBy,
+				IsActive:     newsData.IsActive,
+				SourceType:   sourceType,
+				RSSSourceID:  newsData.RSSSourceID,
+				Link:         newsData.Link,
+				GUID:         newsData.GUID,
+				Author:       newsData.Author,
+				ImageURL:     newsData.ImageURL,
+				Tags:         newsData.Tags,
+				Language:     newsData.Language,
+				ViewCount:    newsData.ViewCount,
+				LikeCount:    newsData.LikeCount,
+				CommentCount: newsData.CommentCount,
+				ShareCount:   newsData.ShareCount,
+				HotnessScore: newsData.HotnessScore,
+				Status:       newsData.Status,
+				IsProcessed:  newsData.IsProcessed,
+			}
+
+			newsList = append(newsList, news)
+			importedCount++
+
+			// 空值不参与去重
+			if newsData.GUID != "" {
+				pendingGUIDs[newsData.GUID] = struct{}{}
+			}
+			if newsData.Link != "" {
+				pendingLinks[newsData.Link] = struct{}{}
+			}
 
-		// 每100条记录批量插入一次，避免单次事务过大
-		if len(newsList) >= 100 {
-			if err := s.batchInsertNews(newsList); err != nil {
-				return fmt.Errorf("failed to batch insert news: %w", err)
+			// 每攒够一批记录插入一次，避免单条语句过大
+			if len(newsList) >= batchSize {
+				if err := s.batchInsertNews(tx, newsList); err != nil {
+					return fmt.Errorf("failed to batch insert news: %w", err)
+				}
+				newsList = newsList[:0] // 清空切片，保留底层数组
+				// 已写入的记录在同一事务中可被数据库查询发现
+				clear(pendingGUIDs)
+				clear(pendingLinks)
 			}
-			newsList = []models.News{} // 清空切片
 		}
-	}
 
-	// 插入剩余的记录
-	if len(newsList) > 0 {
-		if err := s.batchInsertNews(newsList); err != nil {
-			return fmt.Errorf("failed to insert remaining news: %w", err)
+		// 读取数组结束符 ']'
+		if _, err := decoder.Token(); err != nil {
+			return fmt.Errorf("failed to parse JSON data: %w", err)
 		}
+
+		// 插入剩余的记录
+		if len(newsList) > 0 {
+			if err := s.batchInsertNews(tx, newsList); err != nil {
+				return fmt.Errorf("failed to insert remaining news: %w", err)
+			}
+		}
+		return nil
+	})
+	if err != nil {
+		log.Printf("新闻数据导入失败，已回滚本次导入的全部记录")
+		return err
 	}
 
 	log.Printf("新闻数据导入完成！成功导入 %d 条记录，跳过 %d 条重复记录", importedCount, skippedCount)
 	return nil
 }
 
+const (
+	// postgresMaxBindParams PostgreSQL单条语句允许的绑定参数上限
+	postgresMaxBindParams = 65535
+	// maxSeedNewsBatchSize 每批插入新闻数量的上限
+	maxSeedNewsBatchSize = 1000
+)
+
+// newsInsertBatchSize 根据News模型的列数计算每批插入的新闻数量
+// 每批生成一条多行INSERT语句，行数×列数不能超过PostgreSQL的绑定参数上限，模型增加字段后批次自动缩小
+func newsInsertBatchSize(db *gorm.DB) (int, error) {
+	stmt := &gorm.Statement{DB: db}
+	if err := stmt.Parse(&models.News{}); err != nil {
+		return 0, err
+	}
+	return min(maxSeedNewsBatchSize, postgresMaxBindParams/len(stmt.Schema.DBNames)), nil
+}
+
 // batchInsertNews 批量插入新闻记录
-func (s *SeedService) batchInsertNews(newsList []models.News) error {
+func (s *SeedService) batchInsertNews(tx *gorm.DB, newsList []models.News) error {
 	if len(newsList) == 0 {
 		return nil
 	}
 
-	// 使用事务进行批量插入
-	return s.db.Transaction(func(tx *gorm.DB) error {
-		// CreateInBatches 可以进行分批插入，避免单次插入过多数据
-		if err := tx.CreateInBatches(newsList, 50).Error; err != nil {
-			return err
-		}
-		return nil
-	})
+	// 整批记录通过一条多行INSERT语句写入
+	return tx.Create(&newsList).Error
 }
 
 // SeedInitialAdmin 创建初始管理员账户
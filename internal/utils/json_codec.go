@@ -0,0 +1,13 @@
+//go:build !go_json
+
+package utils
+
+import "encoding/json"
+
+// 默认使用标准库进行JSON编解码
+// 使用 -tags=go_json 构建时切换为 goccy/go-json（与 gin 的构建标签保持一致）
+var (
+	JSONMarshal    = json.Marshal
+	JSONUnmarshal  = json.Unmarshal
+	NewJSONDecoder = json.NewDecoder
+)
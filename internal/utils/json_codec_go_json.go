@@ -0,0 +1,12 @@
+//go:build go_json
+
+package utils
+
+import json "github.com/goccy/go-json"
+
+// 使用 goccy/go-json 进行JSON编解码，解析和序列化速度明显快于标准库
+var (
+	JSONMarshal    = json.Marshal
+	JSONUnmarshal  = json.Unmarshal
+	NewJSONDecoder = json.NewDecoder
+)
@@ -1,13 +1,11 @@
 package utils
 
-import "encoding/json"
-
 // SliceToJSON 将字符串切片转换为JSON字符串
 func SliceToJSON(slice []string) string {
 	if len(slice) == 0 {
 		return "[]"
 	}
-	jsonBytes, _ := json.Marshal(slice)
+	jsonBytes, _ := JSONMarshal(slice)
 	return string(jsonBytes)
 }
 
@@ -17,6 +15,6 @@ func JSONToSlice(jsonStr string) []string {
 		return []string{}
 	}
 	var slice []string
-	json.Unmarshal([]byte(jsonStr), &slice)
+	JSONUnmarshal([]byte(jsonStr), &slice)
 	return slice
 }
@@ -0,0 +1,45 @@
+package utils
+
+import "time"
+
+// DateTimeLayout 新闻数据中统一使用的日期时间格式
+const DateTimeLayout = "2006-01-02 15:04:05"
+
+// ParseDateTime 解析 DateTimeLayout 格式的时间字符串（UTC），结果与 time.Parse 一致
+// 格式固定时直接按位置读取各字段，避免 time.Parse 逐段匹配布局串；
+// 不符合格式或字段越界时交由 time.Parse 处理并返回其错误
+func ParseDateTime(value string) (time.Time, error) {
+	if len(value) == len(DateTimeLayout) &&
+		value[4] == '-' && value[7] == '-' && value[10] == ' ' && value[13] == ':' && value[16] == ':' {
+		year, ok1 := parseDigits(value[0:4])
+		month, ok2 := parseDigits(value[5:7])
+		day, ok3 := parseDigits(value[8:10])
+		hour, ok4 := parseDigits(value[11:13])
+		minute, ok5 := parseDigits(value[14:16])
+		second, ok6 := parseDigits(value[17:19])
+
+		if ok1 && ok2 && ok3 && ok4 && ok5 && ok6 &&
+			month >= 1 && month <= 12 && hour < 24 && minute < 60 && second < 60 {
+			t := time.Date(year, time.Month(month), day, hour, minute, second, 0, time.UTC)
+			// time.Date 会自动进位越界的日期（如2月30日），此时交由 time.Parse 报错
+			if t.Day() == day && t.Month() == time.Month(month) {
+				return t, nil
+			}
+		}
+	}
+
+	return time.Parse(DateTimeLayout, value)
+}
+
+// parseDigits 将仅包含十进制数字的字符串转换为整数
+func parseDigits(s string) (int, bool) {
+	n := 0
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if c < '0' || c > '9' {
+			return 0, false
+		}
+		n = n*10 + int(c-'0')
+	}
+	return n, true
+}
@@ -0,0 +1,79 @@
+package utils
+
+import (
+	"fmt"
+	"math/rand"
+	"testing"
+	"time"
+)
+
+// assertSameAsTimeParse 检查 ParseDateTime 与 time.Parse 的结果和是否出错保持一致
+func assertSameAsTimeParse(t *testing.T, value string) {
+	t.Helper()
+
+	got, gotErr := ParseDateTime(value)
+	want, wantErr := time.Parse(DateTimeLayout, value)
+	if (gotErr != nil) != (wantErr != nil) {
+		t.Fatalf("ParseDateTime(%q) error = %v, time.Parse error = %v", value, gotErr, wantErr)
+	}
+	if !got.Equal(want) || got.Location() != want.Location() {
+		t.Fatalf("ParseDateTime(%q) = %v, time.Parse = %v", value, got, want)
+	}
+}
+
+func TestParseDateTime(t *testing.T) {
+	tests := []struct {
+		name    string
+		value   string
+		want    time.Time
+		wantErr bool
+	}{
+		{"标准格式", "2025-06-30 08:15:42", time.Date(2025, 6, 30, 8, 15, 42, 0, time.UTC), false},
+		{"零点", "2024-01-01 00:00:00", time.Date(2024, 1, 1, 0, 0, 0, 0, time.UTC), false},
+		{"闰年2月29日", "2024-02-29 23:59:59", time.Date(2024, 2, 29, 23, 59, 59, 0, time.UTC), false},
+		{"非闰年2月29日", "2023-02-29 12:00:00", time.Time{}, true},
+		{"2月30日", "2024-02-30 12:00:00", time.Time{}, true},
+		{"日期为0", "2024-03-00 12:00:00", time.Time{}, true},
+		{"月份为0", "2024-00-10 12:00:00", time.Time{}, true},
+		{"月份越界", "2024-13-10 12:00:00", time.Time{}, true},
+		{"小时越界", "2024-03-10 24:00:00", time.Time{}, true},
+		{"分钟越界", "2024-03-10 12:60:00", time.Time{}, true},
+		{"秒越界", "2024-03-10 12:00:60", time.Time{}, true},
+		{"非数字", "2024-0a-10 12:00:00", time.Time{}, true},
+		{"分隔符错误", "2024/03/10 12:00:00", time.Time{}, true},
+		{"ISO格式", "2024-03-10T12:00:00", time.Time{}, true},
+		{"长度不足", "2024-3-10 12:00:00", time.Time{}, true},
+		{"空字符串", "", time.Time{}, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := ParseDateTime(tt.value)
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("ParseDateTime(%q) error = %v, wantErr %v", tt.value, err, tt.wantErr)
+			}
+			if !tt.wantErr && !got.Equal(tt.want) {
+				t.Errorf("ParseDateTime(%q) = %v, want %v", tt.value, got, tt.want)
+			}
+			assertSameAsTimeParse(t, tt.value)
+		})
+	}
+}
+
+// TestParseDateTimeRandom 随机生成时间字符串（包含越界字段和非法字符），与 time.Parse 的结果逐一比对
+func TestParseDateTimeRandom(t *testing.T) {
+	r := rand.New(rand.NewSource(1))
+	for i := 0; i < 200000; i++ {
+		value := fmt.Sprintf("%04d-%02d-%02d %02d:%02d:%02d",
+			r.Intn(10000), r.Intn(14), r.Intn(33), r.Intn(26), r.Intn(62), r.Intn(62))
+
+		// 部分用例随机替换一个字符，覆盖分隔符错误和非数字字符
+		if r.Intn(10) == 0 {
+			b := []byte(value)
+			b[r.Intn(len(b))] = "0123456789-: Tx"[r.Intn(15)]
+			value = string(b)
+		}
+
+		assertSameAsTimeParse(t, value)
+	}
+}
@@ -5,6 +5,14 @@ import (
 	"regexp"
 )
 
+// 校验使用的正则表达式
+var (
+	usernameRegex = regexp.MustCompile(`^[a-zA-Z0-9_]+$`)
+	emailRegex    = regexp.MustCompile(`^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$`)
+	letterRegex   = regexp.MustCompile(`[a-zA-Z]`)
+	digitRegex    = regexp.MustCompile(`\d`)
+)
+
 // check if the username is valid
 // 3-20 characters, only letters, numbers and underscores
 func IsValidUsername(username string) bool {
@@ -12,13 +20,11 @@ func IsValidUsername(username string) bool {
 		return false
 	}
 
-	usernameRegex := regexp.MustCompile(`^[a-zA-Z0-9_]+$`)
 	return usernameRegex.MatchString(username)
 }
 
 // check if the email is valid
 func IsValidEmail(email string) bool {
-	emailRegex := regexp.MustCompile(`^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$`)
 	return emailRegex.MatchString(email)
 }
 
@@ -29,8 +35,8 @@ func IsValidPassword(password string) bool {
 		return false
 	}
 
-	hasLetter := regexp.MustCompile(`[a-zA-Z]`).MatchString(password)
-	hasNumber := regexp.MustCompile(`\d`).MatchString(password)
+	hasLetter := letterRegex.MatchString(password)
+	hasNumber := digitRegex.MatchString(password)
 
 	return hasLetter && hasNumber
 }